@@ -46,13 +46,24 @@ from typing import (
     Union,
     Callable
 )
+import atexit
 import functools
 import os
+import sys
 import builtins
 
 from consoleverse.config import lang
 from consoleverse import term
-from consoleverse import exceptions as ex
+# Import the submodule explicitly: `from consoleverse import exceptions`
+# resolves to consoleverse.term.exceptions because the star-import in the
+# package __init__ binds that name first.
+from consoleverse.exceptions import ex_console as ex
+
+try:
+    import numpy as _np
+except ImportError:
+    # numpy is optional; the pure-Python paths cover plain lists.
+    _np = None
 
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
@@ -60,16 +71,117 @@ from consoleverse import exceptions as ex
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 NAME : str = 'ConsoleVerse'
 
+# Shell command to clear the screen, resolved once at import time so
+# clear_screen() does not re-check the platform on every call. Used only
+# as a fallback where the terminal may not honor VT escape sequences.
+_CLEAR_CMD : str = 'cls' if os.name == 'nt' else 'clear'
+
+# ANSI "erase display" + "cursor home"; writing it avoids forking a
+# shell for `clear`/`cls`. Windows consoles without VT processing
+# enabled fall back to the shell command instead.
+_CLEAR_SEQ : str = '\x1b[2J\x1b[H'
+_VT_CLEAR : bool = os.name != 'nt'
+
+# One Language instance covers both prefix tables; no need to build it
+# per entry.
+_LG = lang.Language()
+
 __START_LANGS = {
-    lang.Language()['en'] : 'START',
-    lang.Language()['es'] : 'INICIA',
+    _LG['en'] : 'START',
+    _LG['es'] : 'INICIA',
 }
 
 __END_LANGS = {
-    lang.Language()['en'] : 'END',
-    lang.Language()['es'] : 'TERMINA',
+    _LG['en'] : 'END',
+    _LG['es'] : 'TERMINA',
+}
+
+# Resolved block prefixes for the current language, refreshed only when
+# the language changes so start_block/end_block skip the lookup per call.
+_cached_lang : str = ''
+_cached_start : str = ''
+_cached_end : str = ''
+
+# Bound once so the per-block language check is a plain function call
+# instead of a module attribute lookup followed by a call.
+_current_lang = lang.lang
+
+
+def _block_prefixes() -> tuple:
+    """
+    Return the `(start, end)` block prefixes for the current language,
+    re-resolving them only when the language changes.
+
+    Returns
+    -------
+    tuple
+        The start and end prefixes for the current language
+    """
+    global _cached_lang, _cached_start, _cached_end
+    current = _current_lang()
+    if current != _cached_lang:
+        _cached_lang = current
+        _cached_start = __START_LANGS[current]
+        _cached_end = __END_LANGS[current]
+    return _cached_start, _cached_end
+
+
+# The color/style lookup tables are stateless; build each of them once
+# instead of paying the constructor on every use.
+_CTEXT  = term.ColorText()
+_CBG    = term.ColorBackground()
+_CSTYLE = term.StyleText()
+
+# SGR numeric codes resolved once from the term module, so the hot print
+# path can emit a single `\x1b[<fg>;<bg>;<style>m` sequence instead of one
+# escape sequence per color, background and style.
+_FG_CODES = {
+    name: str(getattr(term.ColorText, f'{name}_CODE'))
+    for name in _CTEXT.COLORS_LIST
+}
+
+_BG_CODES = {
+    name: str(getattr(term.ColorBackground, f'{name}_CODE'))
+    for name in _CBG.BACKGROUNDS_LIST
+}
+
+_STYLE_CODES = {
+    name: str(getattr(term.StyleText, f'{name}_CODE'))
+    for name in _CSTYLE.STYLES_LIST
 }
 
+# String forms treated as missing values when rendering matrices; a
+# frozenset makes the membership test a single hash probe.
+_NAN_STRINGS = frozenset(('None', 'nan', 'NaN', ''))
+
+# The reset escape sequence never changes; compute it once instead of
+# rebuilding it on every colorized println.
+_RESET_SEQ : str = _CTEXT.reset()
+
+
+def _detect_colors() -> bool:
+    """
+    Decide once whether ANSI colors should be emitted: honor the
+    conventional `NO_COLOR`/`FORCE_COLOR` environment variables and
+    otherwise emit colors only when stdout is a terminal.
+
+    Returns
+    -------
+    bool
+        True if escape sequences should be written to stdout
+    """
+    if 'NO_COLOR' in os.environ:
+        return False
+    if os.environ.get('FORCE_COLOR'):
+        return True
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+_colors_enabled : bool = _detect_colors()
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 # ~~                         decorators                         ~~ #
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
@@ -96,17 +208,27 @@ def block(
         The background color of the message, by default has no color
     """
     def decorator(func):
+        is_dict = isinstance(message_block, dict)
+        titles: dict = {}
+        static_title = None if is_dict else str(message_block).upper()
+
         @functools.wraps(func)
         def wrapped(*args, **kwargs):
-            message = message_block
-            if isinstance(message_block, dict):
-                message = message_block[lang.lang()]
+            if is_dict:
+                current = _current_lang()
+                title = titles.get(current)
+                if title is None:
+                    title = titles.setdefault(
+                        current, str(message_block[current]).upper()
+                    )
+            else:
+                title = static_title
 
-            start_block(message, color=text_color, bg_color=bg_color)
-            new_line()
+            _start_block_title(title, color=text_color, bg_color=bg_color,
+                               trailing_newlines=1)
             value = func(*args, **kwargs)
-            new_line()
-            end_block(message, color=text_color, bg_color=bg_color)
+            _end_block_title(title, color=text_color, bg_color=bg_color,
+                             leading_newlines=1)
             return value
         return wrapped
     return decorator
@@ -115,19 +237,77 @@ def block(
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 # ~~                          functions                         ~~ #
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+class _PrintBuffer:
+    """
+    Accumulate console output and flush it to ``sys.stdout`` in batches.
+
+    Writes are collected in memory and flushed once the pending text ends
+    with a newline or grows beyond the flush threshold, so a burst of
+    ``println`` calls costs a single ``write`` instead of one per call.
+    A flush is also registered at interpreter exit so no output is lost.
+    """
+    _FLUSH_THRESHOLD: int = 8192
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._size: int = 0
+        self.immediate: bool = False
+
+    def write(self, text: str) -> None:
+        """
+        Buffer the text, flushing when it ends with a newline, when the
+        size threshold is exceeded, or when buffering is disabled.
+        """
+        self._parts.append(text)
+        self._size += len(text)
+        if self.immediate or self._size >= self._FLUSH_THRESHOLD or text.endswith('\n'):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write all the buffered text to the console
+        """
+        if self._parts:
+            sys.stdout.write(''.join(self._parts))
+            self._parts.clear()
+            self._size = 0
+
+
+_BUF = _PrintBuffer()
+atexit.register(_BUF.flush)
+
+# Bound-method shortcut used on the hot paths: one global load instead of
+# an attribute lookup per write.
+_write = _BUF.write
+
+
 class _ConsoleConfig:
-    _indentation_type  : str = ' '
-    _indentation_lvl   : str = ''
-    _indentantion_size : int = 2
-    _is_init : bool = False
-    _autoreset_colors: bool = True
+    """
+    Mutable console state held on a slotted singleton instance, so the
+    hot print path reads plain slot attributes instead of going through
+    the class dictionary.
+    """
+    __slots__ = (
+        '_indentation_type',
+        '_indent_depth',
+        '_indent_cache',
+        '_indentantion_size',
+        '_is_init',
+        '_autoreset_colors',
+        '_reset_seq',
+    )
+
+    def __init__(self):
+        self.reset_config()
 
-    @staticmethod
     def init(
+            self,
             clear: bool = True,
             indentation_type: str = ' ',
             indentation_size: int = 2,
-            autoreset_colors: bool = True
+            autoreset_colors: bool = True,
+            buffered: bool = True,
+            force_color: bool = False
         ):
         """
         Initialize the console, and resert the indentation level
@@ -137,38 +317,47 @@ class _ConsoleConfig:
         clear : bool, optional
             True to clear the screen and False is not, by default True
         """
-        _ConsoleConfig._indentation_lvl = ''
-        _ConsoleConfig._indentantion_size = indentation_size
-        _ConsoleConfig._indentation_type  = indentation_type
-        _ConsoleConfig._autoreset_colors  = autoreset_colors
+        global _colors_enabled
+        if force_color:
+            _colors_enabled = True
+
+        self._indent_depth = 0
+        self._indent_cache = {0: ''}
+        self._indentantion_size = indentation_size
+        self._indentation_type  = indentation_type
+        self._autoreset_colors  = autoreset_colors
+        self._reset_seq = _RESET_SEQ if autoreset_colors else ''
+        _BUF.immediate = not buffered
 
         if clear:
             clear_screen()
-        _ConsoleConfig._is_init = True
+        self._is_init = True
 
-    @staticmethod
-    def reset_config() -> None:
+    def reset_config(self) -> None:
         """
         Reset the configuration of the console
         """
-        _ConsoleConfig._indentation_type  = ' '
-        _ConsoleConfig._indentation_lvl   = ''
-        _ConsoleConfig._indentantion_size = 2
-        _ConsoleConfig._is_init = False
-        _ConsoleConfig._autoreset_colors = True
-
-    @staticmethod
-    def _init():
+        self._indentation_type  = ' '
+        self._indent_depth      = 0
+        self._indent_cache      = {0: ''}
+        self._indentantion_size = 2
+        self._is_init = False
+        self._autoreset_colors = True
+        # Reset sequence applied when the caller does not force one;
+        # computed once from autoreset_colors so the hot path picks a
+        # string instead of re-evaluating the option.
+        self._reset_seq = _RESET_SEQ
+
+    def _init(self):
         """
         If the console still doesn't start, then start the console without
         indentation.
         """
-        if not _ConsoleConfig._is_init:
-            _ConsoleConfig._is_init = True
-            _ConsoleConfig._indentation_lvl = ''
+        if not self._is_init:
+            self._is_init = True
+            self._indent_depth = 0
 
-    @staticmethod
-    def indentation_lvl() -> str:
+    def indentation_lvl(self) -> str:
         """
         Return the current indentation level
 
@@ -177,31 +366,38 @@ class _ConsoleConfig:
         str
             The current indentation level
         """
-        return _ConsoleConfig._indentation_lvl
+        return self._indent_cache[self._indent_depth]
 
-    @staticmethod
-    def add_indentation_lvl() -> None:
+    def add_indentation_lvl(self) -> None:
         """
         Add one level (indentation)
         """
-        _ConsoleConfig._indentation_lvl += (
-            _ConsoleConfig._indentation_type * _ConsoleConfig._indentantion_size
-        )
+        depth = self._indent_depth + 1
+        self._indent_depth = depth
+        if depth not in self._indent_cache:
+            self._indent_cache[depth] = (
+                self._indentation_type * self._indentantion_size * depth
+            )
 
-    @staticmethod
-    def del_indentation_lvl() -> None:
+    def del_indentation_lvl(self) -> None:
         """
         Substract one level (indentation)
         """
-        _ConsoleConfig._indentation_lvl = \
-            _ConsoleConfig._indentation_lvl[:-_ConsoleConfig._indentantion_size]
+        if self._indent_depth > 0:
+            self._indent_depth -= 1
+
+
+_config = _ConsoleConfig()
+
 
 
 def init(
         clear: bool = True,
         indentation_type: str = ' ',
         indentation_size: int = 2,
-        autoreset_colors: bool = True
+        autoreset_colors: bool = True,
+        buffered: bool = True,
+        force_color: bool = False
     ) -> None:
     """
     Initialize the console, and resert the indentation level
@@ -210,12 +406,22 @@ def init(
     ----------
     clear : bool, optional
         True to clear the screen and False is not, by default True
+
+    buffered : bool, optional
+        True to batch console writes and flush them on newlines,
+        False to flush after every write, by default True
+
+    force_color : bool, optional
+        True to emit ANSI colors even when stdout is not a terminal
+        (e.g. under CI or when piping), by default False
     """
-    _ConsoleConfig.init(
+    _config.init(
         clear=clear,
         indentation_type=indentation_type,
         indentation_size=indentation_size,
-        autoreset_colors=autoreset_colors
+        autoreset_colors=autoreset_colors,
+        buffered=buffered,
+        force_color=force_color
     )
 
 
@@ -223,35 +429,106 @@ def reset_colors() -> None:
     """
     Reset the colors of the console
     """
-    println(term.ColorText().reset(), end='')
+    println(_RESET_SEQ, endl='')
 
 
 def reset_config() -> None:
     """
     Reset the configuration of the console
     """
-    _ConsoleConfig.reset_config()
+    _config.reset_config()
 
 
 def clear_screen():
     """
     Clear the console screen
     """
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if _VT_CLEAR:
+        _write(_CLEAR_SEQ)
+        _BUF.flush()
+    else:
+        os.system(_CLEAR_CMD)
 
 
 def add_lvl():
     """
     Add one level (indentation)
     """
-    _ConsoleConfig.add_indentation_lvl()
+    _config.add_indentation_lvl()
 
 
 def del_lvl():
     """
     Substract one level (indentation)
     """
-    _ConsoleConfig.del_indentation_lvl()
+    _config.del_indentation_lvl()
+
+
+@functools.lru_cache(maxsize=64)
+def _fg_code(color: str) -> str:
+    """
+    Return the SGR code for the color name, memoized so the uppercase
+    normalization and table lookup run once per distinct name.
+    """
+    key = color.upper()
+    if key not in _FG_CODES:
+        raise ex.ErrorNotDefinedColor(color)
+    return _FG_CODES[key]
+
+
+@functools.lru_cache(maxsize=64)
+def _bg_code(bg_color: str) -> str:
+    """
+    Return the SGR code for the background color name, memoized so the
+    normalization and table lookup run once per distinct name.
+    """
+    key = bg_color.upper()
+    if not key.startswith('BG_'):
+        key = f'BG_{key}'
+    if key not in _BG_CODES:
+        raise ex.ErrorNotDefinedColor(bg_color)
+    return _BG_CODES[key]
+
+
+@functools.lru_cache(maxsize=64)
+def _style_code(style: str) -> str:
+    """
+    Return the SGR code for the style name, memoized so the uppercase
+    normalization and table lookup run once per distinct name.
+    """
+    key = style.upper()
+    if key not in _STYLE_CODES:
+        raise ex.ErrorNotDefinedStyle(style)
+    return _STYLE_CODES[key]
+
+
+@functools.lru_cache(maxsize=512)
+def _ansi_prefix(color: str, bg_color: str, style: str) -> str:
+    """
+    Build the combined SGR prefix for a color/background/style triple,
+    memoized so repeated println calls with the same combination skip
+    the per-code lookups and the f-string assembly entirely.
+
+    Returns
+    -------
+    str
+        The escape-sequence prefix, or an empty string when no code
+        applies
+    """
+    codes = []
+
+    if color:
+        codes.append(_fg_code(color))
+
+    if bg_color:
+        codes.append(_bg_code(bg_color))
+
+    if style:
+        codes.append(_style_code(style))
+
+    if not codes:
+        return ''
+    return f'\x1b[{";".join(codes)}m'
 
 
 def _colorize(
@@ -283,53 +560,37 @@ def _colorize(
         by default has no style
 
     reset_console_colors : bool
-        True to reset all colors, False is not necessary, by default `True`
+        True to reset all colors, False to fall back to the console's
+        `autoreset_colors` configuration, by default `True`
 
     Returns
     -------
     str
         The colorized text
     """
-    if color is None:
-        color = ''
-    if bg_color is None:
-        bg_color = ''
-    if style is None:
-        style = ''
+    if not color and not bg_color and not style:
+        return text
 
-    ctext = term.ColorText()
-    if color not in ctext and color != '':
-        raise ex.ErrorNotDefinedColor(color)
-    ctext = ctext[color] if color != '' else ''
+    if not _colors_enabled:
+        return text
 
-    cbaground = term.ColorBackground()
-    if bg_color not in cbaground and bg_color != '':
-        raise ex.ErrorNotDefinedColor(bg_color)
-    cbaground = cbaground[bg_color] if bg_color != '' else ''
-
-    stext = term.StyleText()
-    if style not in stext and style != '':
-        raise ex.ErrorNotDefinedStyle(style)
-    stext = stext[style] if style != '' else ''
-
-    colorized_text = f'{ctext}{cbaground}{stext}{text}'
+    prefix = _ansi_prefix(color, bg_color, style)
+    if not prefix:
+        return text
 
-    if reset_console_colors:
-        colorized_text += term.ColorText().reset()
-
-    return colorized_text
+    reset = _RESET_SEQ if reset_console_colors else _config._reset_seq
+    return ''.join((prefix, text, reset))
 
 
 def println(
         *message: Any,
-        end: str = '\n',
+        endl: str = '\n',
         withlvl: bool = True,
         color: str = '',
         bg_color: str = '',
         reset_all_colors: bool = True,
         style: str = '',
-        sep: str = ' ',
-        **kwargs
+        sep: str = ' '
     ) -> None:
     """
     Print the message to the console, the `endl` is the same as `end` in print function
@@ -341,7 +602,7 @@ def println(
     message : Any
         Message to print to console
 
-    end : str, optional
+    endl : str, optional
         The end of line, by default `\\n`
 
     withlvl : bool, optional
@@ -366,15 +627,20 @@ def println(
 
     sep : str, optional
         The separator between the values, by default is a space
-
-    kwargs : dict
-        Additional parameters to print the function
     """
-    _ConsoleConfig._init()
-    message = __to_string(*message, sep=sep)
+    if not _config._is_init:
+        _config._init()
+    if len(message) == 1 and type(message[0]) is str:
+        message = message[0]
+    else:
+        message = __to_string(*message, sep=sep)
 
     if withlvl:
-        message = _ConsoleConfig.indentation_lvl() + message
+        message = _config.indentation_lvl() + message
+
+    if not color and not bg_color and not style:
+        _write(message + endl)
+        return
 
     colorized_text: str = _colorize(
         text=message,
@@ -383,14 +649,22 @@ def println(
         style=style,
         reset_console_colors=reset_all_colors
     )
-    builtins.print(colorized_text, end=end, **kwargs)
+    _write(colorized_text + endl)
 
 
 def __to_string(*values: Any, sep: str = ' ') -> str:
-    return sep.join([str(m) for m in values])
+    if len(values) == 1:
+        value = values[0]
+        return value if type(value) is str else str(value)
+    return sep.join(map(str, values))
 
 
-def start_block(*message: Any, color: str = 'BLUE', bg_color: str = '') -> None:
+def start_block(
+        *message: Any,
+        color: str = 'BLUE',
+        bg_color: str = '',
+        trailing_newlines: int = 0
+    ) -> None:
     """
     Start a block of messages
 
@@ -404,12 +678,37 @@ def start_block(*message: Any, color: str = 'BLUE', bg_color: str = '') -> None:
 
     bg_color : str, optional
         The background color of the title block, by default has no color
+
+    trailing_newlines : int, optional
+        Number of blank lines to emit after the title within the same
+        write, by default 0
     """
-    message = __to_string(*message)
+    message = message[0] if len(message) == 1 and type(message[0]) is str \
+              else __to_string(*message)
+    _start_block_title(
+        message.upper(),
+        color=color,
+        bg_color=bg_color,
+        trailing_newlines=trailing_newlines
+    )
+
+
+def _start_block_title(
+        title: str,
+        color: str = 'BLUE',
+        bg_color: str = '',
+        trailing_newlines: int = 0
+    ) -> None:
+    """
+    Print an already-uppercased block title and add one indentation
+    level; lets callers with a prebuilt title skip the per-call casing.
+    """
+    start, _ = _block_prefixes()
     println(
-        f'{__START_LANGS[lang.lang()]} {message.upper()}',
+        f'{start} {title}',
         color=color,
-        bg_color=bg_color
+        bg_color=bg_color,
+        endl='\n' + '\n' * trailing_newlines
     )
     add_lvl()
 
@@ -418,7 +717,8 @@ def end_block(
         *message: Any,
         color: str = 'BLUE',
         bg_color: str = '',
-        style: str = ''
+        style: str = '',
+        leading_newlines: int = 0
     ) -> None:
     """
     End a block of messages
@@ -436,16 +736,43 @@ def end_block(
 
     style : str, optional
         The style of the title block, by default has no style
+
+    leading_newlines : int, optional
+        Number of blank lines to emit before the title, by default 0
+    """
+    message = message[0] if len(message) == 1 and type(message[0]) is str \
+              else __to_string(*message)
+    _end_block_title(
+        message.upper(),
+        color=color,
+        bg_color=bg_color,
+        style=style,
+        leading_newlines=leading_newlines
+    )
+
+
+def _end_block_title(
+        title: str,
+        color: str = 'BLUE',
+        bg_color: str = '',
+        style: str = '',
+        leading_newlines: int = 0
+    ) -> None:
+    """
+    Print an already-uppercased block title and remove one indentation
+    level; lets callers with a prebuilt title skip the per-call casing.
     """
-    message = __to_string(*message)
     del_lvl()
+    _, end = _block_prefixes()
+    if leading_newlines:
+        _write('\n' * leading_newlines)
     println(
-        f'{__END_LANGS[lang.lang()]} {message.upper()}',
+        f'{end} {title}',
         color=color,
         bg_color=bg_color,
-        style=style
+        style=style,
+        endl='\n\n'
     )
-    new_line()
 
 
 def warning(
@@ -471,7 +798,8 @@ def warning(
     style : str, optional
         The style of the message, by default has no style
     """
-    message = __to_string(*message)
+    message = message[0] if len(message) == 1 and type(message[0]) is str \
+              else __to_string(*message)
     println(f'warning: {message}', color=color, bg_color=bg_color, style=style)
 
 
@@ -498,7 +826,8 @@ def error(
     style : str, optional
         The style of the message, by default has no style
     """
-    message = __to_string(*message)
+    message = message[0] if len(message) == 1 and type(message[0]) is str \
+              else __to_string(*message)
     println(
         f'error: >>> {message} <<<',
         color=color,
@@ -511,7 +840,9 @@ def new_line():
     """
     Display a blank line in the console
     """
-    println('', withlvl=False)
+    if not _config._is_init:
+        _config._init()
+    _write('\n')
 
 
 def line(
@@ -534,14 +865,99 @@ def line(
     kwargs : dict
         The same parameters of the `println` function
     """
-    full_line: str = line_style * size
-
-    if full_line[:-1] == ' ':
-        full_line = full_line[:-1]
+    full_line: str = (line_style * size).rstrip()
 
     println(full_line, **kwargs)
 
 
+_EMOJI_CLASSES = (
+    term.CountryFlag,
+    term.Arrow,
+    term.Astrology,
+    term.People,
+    term.Heart,
+    term.Hands,
+    term.Nature,
+    term.Objects,
+    term.Information,
+    term.Bar,
+    term.Numbers,
+    term.Line,
+)
+
+
+def print_emoji_list() -> None:
+    """
+    Print the list of supported emojis to the console, grouped by
+    category. The whole listing is assembled in memory and emitted
+    with a single write.
+    """
+    _config._init()
+    indentation: str = _config.indentation_lvl()
+    parts: List[str] = []
+    for group in _EMOJI_CLASSES:
+        parts.append(f'{indentation}{group.__name__}\n')
+        for name, emoji in vars(group).items():
+            if not name.startswith('_') and isinstance(emoji, str):
+                parts.append(f'{indentation}  {emoji}  {name}\n')
+    _write(''.join(parts))
+
+
+def print_color_list() -> None:
+    """
+    Print the list of supported colors and background colors to the
+    console, each name rendered in its own color, using a single write
+    for the whole listing.
+    """
+    _config._init()
+    indentation: str = _config.indentation_lvl()
+    parts: List[str] = []
+    for name in _CTEXT.COLORS_LIST:
+        parts.append(indentation)
+        parts.append(_colorize(name, name, '', '', True))
+        parts.append('\n')
+    for name in _CBG.BACKGROUNDS_LIST:
+        parts.append(indentation)
+        parts.append(_colorize(name, '', name, '', True))
+        parts.append('\n')
+    _write(''.join(parts))
+
+
+def print_style_list() -> None:
+    """
+    Print the list of supported text styles to the console, each name
+    rendered in its own style, using a single write for the whole
+    listing.
+    """
+    _config._init()
+    indentation: str = _config.indentation_lvl()
+    parts: List[str] = []
+    for name in _CSTYLE.STYLES_LIST:
+        parts.append(indentation)
+        parts.append(_colorize(name, '', '', name, True))
+        parts.append('\n')
+    _write(''.join(parts))
+
+
+@functools.lru_cache(maxsize=32)
+def __str_range(n: int) -> tuple:
+    """
+    The decimal string for every index below `n`, memoized so repeated
+    prints of same-shaped matrices reuse the generated labels.
+
+    Parameters
+    ----------
+    n : int
+        The number of labels to generate
+
+    Returns
+    -------
+    tuple
+        The strings '0' through str(n - 1)
+    """
+    return tuple(map(str, range(n)))
+
+
 def __max_len_value(matrix, nan_format) -> int:
     """
     The function calculates the maximum length of a value in a matrix, replacing NaN values with a
@@ -561,20 +977,72 @@ def __max_len_value(matrix, nan_format) -> int:
         an integer value which represents the maximum length of a value in a given matrix.
     """
 
-    def max_value(cell) -> int:
+    nan_len = len(nan_format)
+
+    if _np is not None and isinstance(matrix, _np.ndarray):
+        if matrix.size == 0:
+            return 0
+        cells = matrix.astype(str)
+        lengths = _np.char.str_len(cells)
+        nan_mask = _np.isin(cells, list(_NAN_STRINGS))
+        if nan_mask.any():
+            lengths = _np.where(nan_mask, nan_len, lengths)
+        return int(lengths.max())
+
+    def cell_len(cell) -> int:
         cellstr = str(cell)
-        if cellstr in ('None', 'nan', 'NaN'):
-            cellstr = nan_format
-        return max(max_len, len(cellstr))
-
-    max_len = 0
-    for row in matrix:
-        if isinstance(row, list):
-            for col in row:
-                max_len = max_value(col)
-        else:
-            max_len = max_value(row)
-    return max_len
+        return nan_len if cellstr in _NAN_STRINGS else len(cellstr)
+
+    return max(
+        (
+            cell_len(col)
+            for row in matrix
+            for col in (row if isinstance(row, list) else (row,))
+        ),
+        default=0,
+    )
+
+
+def __cell_formats(max_len_value: Union[int, List[int]]):
+    """
+    Bind the cell format once per matrix: a single `' {: ^N} '.format`
+    when every column shares one width, or one bound format per column.
+    Binding `.format` avoids re-parsing the format spec for every cell.
+
+    Parameters
+    ----------
+    max_len_value : int | List[int]
+        Longest value size in the matrix, or one size per column
+
+    Returns
+    -------
+    Callable | List[Callable]
+        The formatter function(s) used to render each cell
+    """
+    if isinstance(max_len_value, int):
+        return __center_cell(max_len_value)
+    return [__center_cell(width) for width in max_len_value]
+
+
+def __center_cell(width: int):
+    """
+    Return a formatter that centers a value in `width` characters with
+    a space on either side; `str.center` is a direct C call that skips
+    the format-spec parser.
+
+    Parameters
+    ----------
+    width : int
+        The column width to center the value in
+
+    Returns
+    -------
+    Callable
+        The cell formatter
+    """
+    def fmt(value) -> str:
+        return ' ' + str(value).center(width) + ' '
+    return fmt
 
 
 def __print_matrix_header(
@@ -582,8 +1050,8 @@ def __print_matrix_header(
         len_index: int,
         color_index: str,
         extra_spacing: str,
-        withlvl: bool,
-        max_len_value: int,
+        indentation: str,
+        cell_fmts,
         lvl_space: int = 3
     ) -> None:
     """
@@ -604,29 +1072,29 @@ def __print_matrix_header(
     extra_spacing : str
         The extra spacing befote printing the header
 
-    withlvl : bool
-        True if the matrix should be printed with the current indentation False in otherwise
+    indentation : str
+        The indentation of the line, already resolved by the caller
 
-    max_len_value : int
-        Longest value size in the matrix
+    cell_fmts : Callable | List[Callable]
+        The bound cell format(s) built by `__cell_formats`
 
     lvl_space : int
         Number of aditional spaces based on the style
     """
     spaces: str = ' ' * (len_index + lvl_space)
-    indentation: str = _ConsoleConfig.indentation_lvl() if withlvl else ''
+    one_fmt = None if isinstance(cell_fmts, list) else cell_fmts
 
-    println(f'{indentation}{spaces}{extra_spacing}', end='', withlvl=False)
+    parts: List[str] = [f'{indentation}{spaces}{extra_spacing}']
     for i, h in enumerate(header):
-        width = max_len_value if isinstance(max_len_value, int) else max_len_value[i]
-
-        println(f' {h : ^{width}} ', color=color_index, end='', withlvl=False)
-    new_line()
+        fmt = one_fmt if one_fmt is not None else cell_fmts[i]
+        parts.append(_colorize(fmt(h), color_index, '', '', True))
+    parts.append('\n')
+    _write(''.join(parts))
 
 
 def __print_matrix_row(
         row: list,
-        max_len_value: int,
+        cell_fmts,
         color: str,
         nan_format: str,
         color_style: str,
@@ -634,18 +1102,19 @@ def __print_matrix_row(
         end_line: str,
         start_line: str,
         index_name: str,
-        indentation: str
-    ) -> None:
+        indentation: str,
+        line_prefix: str = ''
+    ) -> str:
     """
-    Printed the row of the matrix.
+    Render the row of the matrix.
 
     Parameters
     ----------
     row : list
         The row of the matrix to be printed
 
-    max_len_value : int
-        Longest value size in the matrix
+    cell_fmts : Callable | List[Callable]
+        The bound cell format(s) built by `__cell_formats`
 
     color : str
         The color of the matrix items, the color must be one of the `console.ColorText()`
@@ -674,17 +1143,31 @@ def __print_matrix_row(
 
     indentation : str
         The indentation of the line
+
+    line_prefix : str
+        An already-colorized fragment written before the row, by default ''
+
+    Returns
+    -------
+    str
+        The rendered row, including the trailing newline
     """
-    println(indentation, end='', withlvl=False)
-    println(index_name,  end='', color=color_index, withlvl=False)
-    println(start_line,  end='', color=color_style, withlvl=False)
+    one_fmt = None if isinstance(cell_fmts, list) else cell_fmts
+    parts: List[str] = [
+        line_prefix,
+        indentation,
+        _colorize(index_name, color_index, '', '', True),
+        _colorize(start_line, color_style, '', '', True),
+    ]
 
     for i, cell in enumerate(row):
-        cellstr = str(cell) if str(cell) not in ('None', 'nan', 'NaN', '') else nan_format
+        cellstr = str(cell) if str(cell) not in _NAN_STRINGS else nan_format
 
-        width = max_len_value if isinstance(max_len_value, int) else max_len_value[i]
-        println(f' {cellstr : ^{width}} ', color=color, end='', withlvl=False)
-    println(end_line, color=color_style, withlvl=False)
+        fmt = one_fmt if one_fmt is not None else cell_fmts[i]
+        parts.append(_colorize(fmt(cellstr), color, '', '', True))
+    parts.append(_colorize(end_line, color_style, '', '', True))
+    parts.append('\n')
+    return ''.join(parts)
 
 
 def __print_matrix_base(
@@ -780,35 +1263,44 @@ def __print_matrix_base(
     level_space : int, optional
         The space between the level and the matrix, by default 3
     """
-    indentation: str = _ConsoleConfig.indentation_lvl() if withlvl else ''
+    indentation: str = _config.indentation_lvl() if withlvl else ''
+    cell_fmts = __cell_formats(max_len_value)
 
     if header:
         __print_matrix_header(header=header,
                               len_index=len_index,
                               color_index=color_index,
                               extra_spacing='',
-                              withlvl=withlvl,
-                              max_len_value=max_len_value,
+                              indentation=indentation,
+                              cell_fmts=cell_fmts,
                               lvl_space=level_space
                               )
 
     if top_line is not None and top_line != '':
         println(top_line, color=color_style, withlvl=False)
 
-    for index_row_id, row in enumerate(matrix):
+    # Right-aligned index labels padded once before the loop; rjust is
+    # a direct C call and the f-string spec was re-parsed per row.
+    padded_indexes = None if indexes is None \
+                     else [str(i).rjust(len_index) for i in indexes]
+
+    rows: List[str] = [
         __print_matrix_row(row = row,
-                           max_len_value = max_len_value,
+                           cell_fmts = cell_fmts,
                            color = color,
                            nan_format = nan_format,
                            color_style = color_style,
                            color_index = color_index,
                            end_line = end_line,
                            start_line = start_line,
-                           index_name = f'{indexes[index_row_id]: >{len_index}}'
-                                        if indexes is not None
+                           index_name = padded_indexes[index_row_id]
+                                        if padded_indexes is not None
                                         else '',
                            indentation = indentation
                            )
+        for index_row_id, row in enumerate(matrix)
+    ]
+    _write(''.join(rows))
 
     if bottom_line is not None and bottom_line != '':
         println(bottom_line, color=color_style, withlvl=False)
@@ -825,7 +1317,8 @@ def __print_matrix_box_style(
         max_len_value: int,
         len_index: int,
         style : str,
-        withlvl: bool
+        withlvl: bool,
+        ncols: int = 0
     ) -> None:
     """
     The matrix has been printed in a box or semibox style.
@@ -878,14 +1371,13 @@ def __print_matrix_box_style(
 
     withlvl : bool, optional
         True if the matrix should be printed with the current indentation False in otherwise
+
+    ncols : int, optional
+        The number of columns in the matrix, computed once by `print_matrix`, by default 0
     """
-    try:
-        len_matrix = len(matrix[0])
-    except:
-        len_matrix = len(header)
-    div: str = __define_divider_line('-', max_len_value, len_matrix)
+    div: str = __define_divider_line('-', max_len_value, ncols)
     spaces: str = ' ' * (len_index + 3)
-    indentation: str = _ConsoleConfig.indentation_lvl() if withlvl else ''
+    indentation: str = _config.indentation_lvl() if withlvl else ''
 
     __print_matrix_base(
         matrix=matrix,
@@ -902,11 +1394,14 @@ def __print_matrix_box_style(
         start_line=' | ',
         end_line=' |' if style == 'box' else '',
         top_line=f'{indentation}{spaces}{div}',
-        bottom_line=f'{indentation}{spaces}{div}' if style == 'box' else new_line(),
+        bottom_line=f'{indentation}{spaces}{div}' if style == 'box' else '',
         middle_vertical_line=None,
         middle_horizontal_line=None
     )
 
+    if style != 'box':
+        new_line()
+
 
 def __print_matrix_numpy_style(
         matrix,
@@ -919,7 +1414,8 @@ def __print_matrix_numpy_style(
         color_style: str,
         max_len_value: int,
         len_index: int,
-        withlvl: bool
+        withlvl: bool,
+        ncols: int = 0
     ) -> None:
     """
     The matrix has been printed in a box or semibox style.
@@ -967,39 +1463,63 @@ def __print_matrix_numpy_style(
 
     withlvl : bool, optional
         True if the matrix should be printed with the current indentation False in otherwise
+
+    ncols : int, optional
+        The number of columns in the matrix, computed once by `print_matrix`, by default 0
     """
-    indentation: str = _ConsoleConfig.indentation_lvl() if withlvl else ''
+    indentation: str = _config.indentation_lvl() if withlvl else ''
+
+    # Bare ndarrays without header or indexes can be rendered entirely
+    # by NumPy's C-level formatter instead of the Python row loop.
+    if (
+        _np is not None
+        and isinstance(matrix, _np.ndarray)
+        and header is None
+        and indexes is None
+    ):
+        rendered = _np.array2string(matrix)
+        if indentation:
+            rendered = indentation + rendered.replace('\n', f'\n{indentation}')
+        println(rendered, color=color, withlvl=False)
+        return
+
+    cell_fmts = __cell_formats(max_len_value)
 
     if header is not None:
         __print_matrix_header(header = header,
                               len_index = len_index,
                               color_index = color_index,
                               extra_spacing = '   ',
-                              withlvl = withlvl,
-                              max_len_value = max_len_value
+                              indentation = indentation,
+                              cell_fmts = cell_fmts
                               )
 
     max_rows: int = len(matrix)
 
-    for index_row_id, row in enumerate(matrix):
-        # string line
-        if index_row_id == 0:
-            println(indentation, '[ ', end='', color=color_style, withlvl=False)
-        else:
-            println('  ', indentation, end='', withlvl=False)
+    # Opening bracket on the first line, alignment spacing on the rest;
+    # both are part of the row write instead of a separate println.
+    first_prefix: str = _colorize(f'{indentation} [ ', color_style, '', '', True)
+    rest_prefix: str = f'   {indentation}'
+    padded_indexes = None if indexes is None \
+                     else [str(i).rjust(len_index) for i in indexes]
 
+    rows: List[str] = [
         __print_matrix_row(
             row = row,
-            max_len_value = max_len_value,
+            cell_fmts = cell_fmts,
             color = color,
             nan_format = nan_format,
             color_style = color_style,
             color_index = color_index,
             end_line = ' ]' if max_rows != index_row_id + 1 else ' ]  ]',
             start_line = ' [ ',
-            index_name = f'{indexes[index_row_id]: >{len_index}}' if indexes is not None else '',
-            indentation = indentation
+            index_name = padded_indexes[index_row_id] if padded_indexes is not None else '',
+            indentation = indentation,
+            line_prefix = first_prefix if index_row_id == 0 else rest_prefix
         )
+        for index_row_id, row in enumerate(matrix)
+    ]
+    _write(''.join(rows))
 
 
 def __print_matrix_without_style(
@@ -1013,7 +1533,8 @@ def __print_matrix_without_style(
         color_style: str,
         max_len_value: int,
         len_index: int,
-        withlvl: bool
+        withlvl: bool,
+        ncols: int = 0
     ) -> None:
     """
     The matrix has been printed in a box or semibox style.
@@ -1061,6 +1582,9 @@ def __print_matrix_without_style(
 
     withlvl : bool, optional
         True if the matrix should be printed with the current indentation False in otherwise
+
+    ncols : int, optional
+        The number of columns in the matrix, computed once by `print_matrix`, by default 0
     """
     __print_matrix_base(
         matrix=matrix,
@@ -1105,11 +1629,32 @@ def __define_divider_line(style: str, max_len_value: int | list, len_matrix: int
         The divider line
     """
     if isinstance(max_len_value, list):
-        width: int = sum(w for w in max_len_value)
+        width: int = sum(max_len_value)
     else:
         width: int = max_len_value * (len_matrix - 1)
-    div: str = style * width + style * (len_matrix * 2)
-    return div
+    return __rule(style, width + len_matrix * 2)
+
+
+@functools.lru_cache(maxsize=64)
+def __rule(char: str, length: int) -> str:
+    """
+    Memoized horizontal rule, so printing several same-shaped matrices
+    reuses the divider string instead of re-multiplying it.
+
+    Parameters
+    ----------
+    char : str
+        The character the rule is made of
+
+    length : int
+        The number of repetitions
+
+    Returns
+    -------
+    str
+        The rule string
+    """
+    return char * length
 
 
 def __print_matrix_simpleline_style(
@@ -1123,7 +1668,8 @@ def __print_matrix_simpleline_style(
         max_len_value: int,
         len_index: int,
         style : str,
-        withlvl: bool
+        withlvl: bool,
+        ncols: int = 0
     ) -> None:
     """
     The matrix has been printed in a box or semibox style.
@@ -1176,14 +1722,19 @@ def __print_matrix_simpleline_style(
 
     withlvl : bool, optional
         True if the matrix should be printed with the current indentation False in otherwise
+
+    ncols : int, optional
+        The number of columns in the matrix, computed once by `print_matrix`, by default 0
     """
-    try:
-        len_matrix = len(matrix[0])
-    except:
-        len_matrix = len(header)
-    div: str = __define_divider_line(term.Line.SH, max_len_value, len_matrix + 1)
+    # Bind the line-drawing characters once; each term.Line access is
+    # an attribute lookup repeated for every border fragment otherwise.
+    sh, sv = term.Line.SH, term.Line.SV
+    stl, strr = term.Line.STL, term.Line.STR
+    sbl, sbr = term.Line.SBL, term.Line.SBR
+
+    div: str = __define_divider_line(sh, max_len_value, ncols + 1)
     spaces: str = ' ' * (len_index + 1)
-    indentation: str = _ConsoleConfig.indentation_lvl() if withlvl else ''
+    indentation: str = _config.indentation_lvl() if withlvl else ''
 
     __print_matrix_base(
         matrix=matrix,
@@ -1197,10 +1748,10 @@ def __print_matrix_simpleline_style(
         len_index=len_index,
         style=style,
         withlvl=withlvl,
-        start_line=f' {term.Line.SV} ',
-        end_line=f' {term.Line.SV} ',
-        top_line=f'{indentation}{spaces}{term.Line.STL}{div}{term.Line.STR}',
-        bottom_line=f'{indentation}{spaces}{term.Line.SBL}{div}{term.Line.SBR}',
+        start_line=f' {sv} ',
+        end_line=f' {sv} ',
+        top_line=''.join((indentation, spaces, stl, div, strr)),
+        bottom_line=''.join((indentation, spaces, sbl, div, sbr)),
         middle_vertical_line=None,
         middle_horizontal_line=None
     )
@@ -1216,7 +1767,8 @@ def __print_matrix_doubleline_style(matrix,
                                     max_len_value: int,
                                     len_index: int,
                                     style : str,
-                                    withlvl: bool
+                                    withlvl: bool,
+                                    ncols: int = 0
                                     ) -> None:
     """
     The matrix has been printed in a box or semibox style.
@@ -1269,14 +1821,19 @@ def __print_matrix_doubleline_style(matrix,
 
     withlvl : bool, optional
         True if the matrix should be printed with the current indentation False in otherwise
+
+    ncols : int, optional
+        The number of columns in the matrix, computed once by `print_matrix`, by default 0
     """
-    try:
-        len_matrix = len(matrix[0])
-    except:
-        len_matrix = len(header)
-    div: str = __define_divider_line(term.Line.DH, max_len_value, len_matrix + 1)
+    # Bind the line-drawing characters once; each term.Line access is
+    # an attribute lookup repeated for every border fragment otherwise.
+    dh, dv = term.Line.DH, term.Line.DV
+    dtl, dtr = term.Line.DTL, term.Line.DTR
+    dbl, dbr = term.Line.DBL, term.Line.DBR
+
+    div: str = __define_divider_line(dh, max_len_value, ncols + 1)
     spaces: str = ' ' * (len_index + 1)
-    indentation: str = _ConsoleConfig.indentation_lvl() if withlvl else ''
+    indentation: str = _config.indentation_lvl() if withlvl else ''
 
     __print_matrix_base(
         matrix=matrix,
@@ -1290,10 +1847,10 @@ def __print_matrix_doubleline_style(matrix,
         len_index=len_index,
         style=style,
         withlvl=withlvl,
-        start_line=f' {term.Line.DV} ',
-        end_line=f' {term.Line.DV} ',
-        top_line=f'{indentation}{spaces}{term.Line.DTL}{div}{term.Line.DTR}',
-        bottom_line=f'{indentation}{spaces}{term.Line.DBL}{div}{term.Line.DBR}',
+        start_line=f' {dv} ',
+        end_line=f' {dv} ',
+        top_line=''.join((indentation, spaces, dtl, div, dtr)),
+        bottom_line=''.join((indentation, spaces, dbl, div, dbr)),
         middle_vertical_line=None,
         middle_horizontal_line=None
     )
@@ -1333,7 +1890,8 @@ def print_title(
     num_values : int, optional
         The number of values to be displayed, by default 30
     """
-    message = __to_string(*message)
+    message = message[0] if len(message) == 1 and type(message[0]) is str \
+              else __to_string(*message)
 
     new_line()
 
@@ -1465,10 +2023,10 @@ def print_matrix(
         If the style is not defined
     """
     if indexes == 'all':
-        indexes = [str(i) for i in range(len(matrix))]
+        indexes = __str_range(len(matrix))
 
     if header == 'all':
-        header = [str(i) for i in range(len(matrix[0]))]
+        header = __str_range(len(matrix[0]))
 
     if column_width == 'equal':
         max_len_value = __max_len_value(matrix, nan_format)
@@ -1481,6 +2039,11 @@ def print_matrix(
         matrix_by_column = list(zip(*matrix_with_header))
         max_len_value = [__max_len_value(column, nan_format) for column in matrix_by_column]
 
+    try:
+        ncols: int = len(matrix[0])
+    except:
+        ncols: int = len(header)
+
     if title:
         space = max([len(str(i)) for i in indexes]) + sum(len(str(i)) + 3 for i in header) + 2
         print_title(
@@ -1494,7 +2057,7 @@ def print_matrix(
 
     len_index = 0
 
-    if isinstance(indexes, list):
+    if isinstance(indexes, (list, tuple)):
         len_index: int = __max_len_value(indexes, nan_format)
 
     kwargs = {
@@ -1508,21 +2071,31 @@ def print_matrix(
         'max_len_value' : max_len_value,
         'len_index' : len_index,
         'style' : style,
-        'withlvl' : withlvl
+        'withlvl' : withlvl,
+        'ncols' : ncols
     }
 
-    if style is None:
-        __print_matrix_without_style(**kwargs)
-    elif style in ('box', 'semibox'):
-        __print_matrix_box_style(**kwargs)
-    elif style in ('numpy', 'np'):
-        __print_matrix_numpy_style(**kwargs)
-    elif style in ('simpleline', 'sl', 'line'):
-        __print_matrix_simpleline_style(**kwargs)
-    elif style in ('doubleline', 'dl'):
-        __print_matrix_doubleline_style(**kwargs)
-    else:
+    try:
+        renderer = _STYLE_DISPATCH[style]
+    except (KeyError, TypeError):
         raise ex.ErrorNotDefinedStyle(style)
+    renderer(**kwargs)
+
+
+# Style-name-to-renderer table for print_matrix; one dict probe instead
+# of walking an if/elif chain of membership tests.
+_STYLE_DISPATCH = {
+    None         : __print_matrix_without_style,
+    'box'        : __print_matrix_box_style,
+    'semibox'    : __print_matrix_box_style,
+    'numpy'      : __print_matrix_numpy_style,
+    'np'         : __print_matrix_numpy_style,
+    'simpleline' : __print_matrix_simpleline_style,
+    'sl'         : __print_matrix_simpleline_style,
+    'line'       : __print_matrix_simpleline_style,
+    'doubleline' : __print_matrix_doubleline_style,
+    'dl'         : __print_matrix_doubleline_style,
+}
 
 
 def inputln(
@@ -1578,7 +2151,7 @@ def inputln(
     """
     println(
         *message,
-        end=endl,
+        endl=endl,
         withlvl=withlvl,
         color=color,
         bg_color=bg_color,
@@ -1586,6 +2159,7 @@ def inputln(
         style=style,
         sep=sep
     )
+    _BUF.flush()
 
     return input_type(builtins.input())
 
@@ -1684,8 +2258,6 @@ def textbox(
     ... │ ConsoleVerse │
     ... └───────────────┘
     """
-    pln = lambda s: println(s, withlvl=withlvl, color=border_color, style=border_style)
-
     _bs = {
         'simpleline': {
             'top_left': term.Line.STL,
@@ -1707,7 +2279,7 @@ def textbox(
 
     message = __to_string(*message, sep=sep)
     lines = message.split('\n')
-    max_len = max([len(l) for l in lines])
+    max_len = max(map(len, lines))
     bname = ''
 
     if isinstance(border, dict):
@@ -1729,37 +2301,60 @@ def textbox(
     vertical = _bs[bname]['vertical']
     vertical_blank = vertical + ' ' * (max_len + 2) + vertical
 
-    pln(top)
+    if not _config._is_init:
+        _config._init()
+    indentation: str = _config.indentation_lvl() if withlvl else ''
+
+    alignments = {
+        'c': '^',
+        'r': '>',
+        'l': '<',
+        'center': '^',
+        'right': '>',
+        'left': '<',
+    }
+    align_char = alignments.get(text_align, '<')
+
+    # Pre-colorized fragments shared by every line of the box, so the
+    # whole box is assembled in memory and emitted in one write.
+    left_border = _colorize(indentation + vertical, border_color, '',
+                            border_style, True)
+    right_border = _colorize(vertical, border_color, '', border_style, True)
+    blank_line = _colorize(indentation + vertical_blank, border_color, '',
+                           border_style, True) + '\n'
+
+    parts: List[str] = [
+        _colorize(indentation + top, border_color, '', border_style, True),
+        '\n',
+    ]
     if allow_empty:
-        pln(vertical_blank)
+        parts.append(blank_line)
 
-    for l in lines:
-        alignments = {
-            'c': '^',
-            'r': '>',
-            'l': '<',
-            'center': '^',
-            'right': '>',
-            'left': '<',
-        }
+    # Padding strings reused across equal-length lines for the default
+    # left alignment; other alignments keep the format-spec path.
+    pad_cache: dict = {}
 
-        align_line = f' {l:{alignments.get(text_align, "<")}{max_len}} '
-
-        println(vertical, withlvl=withlvl, color=border_color, style=border_style, end='')
-        println(
-            align_line,
-            withlvl=False,
-            color=color,
-            bg_color=bg_color,
-            reset_all_colors=reset_all_colors,
-            style=style,
-            end=''
-        )
-        println(vertical, withlvl=False, color=border_color, style=border_style)
+    for l in lines:
+        if align_char == '<':
+            n = max_len - len(l)
+            pad = pad_cache.get(n)
+            if pad is None:
+                pad = pad_cache.setdefault(n, ' ' * n)
+            align_line = f' {l}{pad} '
+        else:
+            align_line = f' {l:{align_char}{max_len}} '
+        parts.append(left_border)
+        parts.append(_colorize(align_line, color, bg_color,
+                               style, reset_all_colors))
+        parts.append(right_border)
+        parts.append('\n')
 
     if allow_empty:
-        pln(vertical_blank)
-    pln(bottom)
+        parts.append(blank_line)
+    parts.append(_colorize(indentation + bottom, border_color, '',
+                           border_style, True))
+    parts.append('\n')
+    _write(''.join(parts))
 
 
 def progress_bar(
@@ -1832,10 +2427,16 @@ def progress_bar(
         raise ValueError('The end_bar must be a single character')
 
     progressing_bar = int(progress * width)
-    pct_bar = ' (' + str(int(progress * 100)) + '%)' if pct else ''
+    pct_bar = f' ({int(progress * 100)}%)' if pct else ''
 
     println(
-        start_bar + bar * progressing_bar + spacing * (width - progressing_bar) + end_bar + pct_bar,
+        ''.join((
+            start_bar,
+            bar * progressing_bar,
+            spacing * (width - progressing_bar),
+            end_bar,
+            pct_bar,
+        )),
         **kwargs
     )
 
@@ -1938,7 +2539,7 @@ def print_tree(
             else:
                 bar_line = f'{vertical_and_right}{horizontal}'
 
-            println(f'{start_bar}{bar_line}', color=color_tree, end=' ')
+            println(f'{start_bar}{bar_line}', color=color_tree, endl=' ')
             println(k, **println_options)
 
             if isinstance(v, dict):
@@ -1950,7 +2551,7 @@ def print_tree(
             else:
                 last_lvl = ' ' if i == len_sub_tree - 1 else vertical
                 bar_line = f'{start_bar}{last_lvl}  {down_left}{horizontal}'
-                println(bar_line, color=color_tree, end=' ')
+                println(bar_line, color=color_tree, endl=' ')
                 println(v, **println_options)
 
     recursive_print_tree(tree)
@@ -4,8 +4,8 @@ from consoleverse.config import lang
 class ValueErrorConsole(ValueError):...
 class ErrorNotDefinedStyle(ValueErrorConsole):
     MSG = {
-        lang.Language()['en']: 'The style "{}" is not defined in the consoleverse',
-        lang.Language()['es']: 'El estilo "{}" no esta definido en el consoleverse',
+        'en': 'The style "{}" is not defined in the consoleverse',
+        'es': 'El estilo "{}" no esta definido en el consoleverse',
     }
 
     def __init__(self, style: str):
@@ -18,8 +18,8 @@ class ErrorNotDefinedStyle(ValueErrorConsole):
 
 class ErrorNotDefinedBorderStyle(ValueErrorConsole):
     MSG = {
-        lang.Language()['en']: 'The border style "{}" is not defined in the consoleverse',
-        lang.Language()['es']: 'El estilo de borde "{}" no esta definido en el consoleverse',
+        'en': 'The border style "{}" is not defined in the consoleverse',
+        'es': 'El estilo de borde "{}" no esta definido en el consoleverse',
     }
 
     def __init__(self, border_style: str):
@@ -32,8 +32,8 @@ class ErrorNotDefinedBorderStyle(ValueErrorConsole):
 
 class ErrorNotDefinedColor(ValueErrorConsole):
     MSG = {
-        lang.Language()['en']: 'The color "{}" is not defined in the consoleverse',
-        lang.Language()['es']: 'El color "{}" no esta definido en el consoleverse',
+        'en': 'The color "{}" is not defined in the consoleverse',
+        'es': 'El color "{}" no esta definido en el consoleverse',
     }
 
     def __init__(self, color: str):
@@ -44,6 +44,8 @@ The following are the available text styles:
     - HIDDEN
 """
 
+from types import MappingProxyType
+
 from consoleverse.term.exceptions.ex_colors import (
     ColorTextError,
     ColorBackgroundError,
@@ -51,6 +53,27 @@ from consoleverse.term.exceptions.ex_colors import (
 )
 
 
+def _sgr_table(code_cls, names) -> MappingProxyType:
+    """
+    Build a read-only name-to-escape-sequence table from the `*_CODE`
+    constants of `code_cls`, so every instance of a lookup class shares
+    one immutable dict instead of rebuilding it per construction.
+    """
+    return MappingProxyType({
+        name: f'\033[{getattr(code_cls, f"{name}_CODE")}m' for name in names
+    })
+
+
+def _case_table(table) -> MappingProxyType:
+    """
+    Extend a lookup table with its lowercase keys, read-only.
+    """
+    return MappingProxyType({
+        **table,
+        **{name.lower(): seq for name, seq in table.items()},
+    })
+
+
 class _ColorBase:
     """
     This class is used as a base class for the color classes.
@@ -62,7 +85,7 @@ class _ColorBase:
     END_FORMAT_COLOR: str   = START_FORMAT_COLOR.format(RESET_FORMAT_COLOR)
 
     def start(self, color):
-        return self.START_FORMAT_COLOR.format(color)
+        return f'\033[{color}m'
 
     def end(self):
         return self.END_FORMAT_COLOR
@@ -115,21 +138,21 @@ class ColorText(ColorTextCode):
     CYAN    = 'CYAN'
     WHITE   = 'WHITE'
 
-    def __init__(self):
-        self.COLORS = {
-            self.BLACK   : self.start(self.BLACK_CODE),
-            self.RED     : self.start(self.RED_CODE),
-            self.GREEN   : self.start(self.GREEN_CODE),
-            self.YELLOW  : self.start(self.YELLOW_CODE),
-            self.BLUE    : self.start(self.BLUE_CODE),
-            self.MAGENTA : self.start(self.MAGENTA_CODE),
-            self.CYAN    : self.start(self.CYAN_CODE),
-            self.WHITE   : self.start(self.WHITE_CODE),
-        }
+    # Shared immutable tables; instances no longer rebuild them.
+    COLORS = _sgr_table(ColorTextCode, (
+        BLACK, RED, GREEN, YELLOW, BLUE, MAGENTA, CYAN, WHITE,
+    ))
+    COLORS_LIST = list(COLORS)
 
-        self.COLORS_LIST = list(self.COLORS.keys())
+    # Same table keyed by the lowercase names as well, so lookups
+    # with an exact-case key skip the per-call str.upper().
+    _COLORS_LOOKUP = _case_table(COLORS)
 
     def __getitem__(self, color):
+        try:
+            return self._COLORS_LOOKUP[color]
+        except (KeyError, TypeError):
+            pass
         try:
             return self.COLORS[color.upper()]
         except KeyError:
@@ -137,7 +160,7 @@ class ColorText(ColorTextCode):
 
     def __contains__(self, color):
         if color:
-            return color.upper() in self.COLORS
+            return color in self._COLORS_LOOKUP or color.upper() in self.COLORS
 
     def __str__(self):
         return str(self.COLORS_LIST)
@@ -187,21 +210,27 @@ class ColorBackground(ColorBackgroundCode):
     BG_CYAN    = 'BG_CYAN'
     BG_WHITE   = 'BG_WHITE'
 
-    def __init__(self):
-        self.BACKGROUNDS = {
-            self.BG_BLACK   : self.start(self.BG_BLACK_CODE),
-            self.BG_RED     : self.start(self.BG_RED_CODE),
-            self.BG_GREEN   : self.start(self.BG_GREEN_CODE),
-            self.BG_YELLOW  : self.start(self.BG_YELLOW_CODE),
-            self.BG_BLUE    : self.start(self.BG_BLUE_CODE),
-            self.BG_MAGENTA : self.start(self.BG_MAGENTA_CODE),
-            self.BG_CYAN    : self.start(self.BG_CYAN_CODE),
-            self.BG_WHITE   : self.start(self.BG_WHITE_CODE),
-        }
-
-        self.BACKGROUNDS_LIST = list(self.BACKGROUNDS.keys())
+    # Shared immutable tables; instances no longer rebuild them.
+    BACKGROUNDS = _sgr_table(ColorBackgroundCode, (
+        BG_BLACK, BG_RED, BG_GREEN, BG_YELLOW,
+        BG_BLUE, BG_MAGENTA, BG_CYAN, BG_WHITE,
+    ))
+    BACKGROUNDS_LIST = list(BACKGROUNDS)
+
+    # Same table keyed by the lowercase names (with and without the
+    # BG_ prefix), so exact-case lookups skip the normalization.
+    _BACKGROUNDS_LOOKUP = MappingProxyType({
+        **BACKGROUNDS,
+        **{name.lower(): seq for name, seq in BACKGROUNDS.items()},
+        **{name[3:]: seq for name, seq in BACKGROUNDS.items()},
+        **{name[3:].lower(): seq for name, seq in BACKGROUNDS.items()},
+    })
 
     def __getitem__(self, background):
+        try:
+            return self._BACKGROUNDS_LOOKUP[background]
+        except (KeyError, TypeError):
+            pass
         try:
             if 'BG_' not in background:
                 background = f'BG_{background}'
@@ -210,6 +239,8 @@ class ColorBackground(ColorBackgroundCode):
             raise ColorBackgroundError(background)
 
     def __contains__(self, background):
+        if background in self._BACKGROUNDS_LOOKUP:
+            return True
         if 'BG_' not in background:
                 background = f'BG_{background}'
         return background.upper() in self.BACKGROUNDS
@@ -255,26 +286,28 @@ class StyleText(StyleTextCode):
     REVERSE   = 'REVERSE'
     HIDDEN    = 'HIDDEN'
 
-    def __init__(self):
-        self.STYLES = {
-            self.BOLD      : self.start(self.BOLD_CODE),
-            self.DIM       : self.start(self.DIM_CODE),
-            self.UNDERLINE : self.start(self.UNDERLINE_CODE),
-            self.BLINK     : self.start(self.BLINK_CODE),
-            self.REVERSE   : self.start(self.REVERSE_CODE),
-            self.HIDDEN    : self.start(self.HIDDEN_CODE),
-        }
+    # Shared immutable tables; instances no longer rebuild them.
+    STYLES = _sgr_table(StyleTextCode, (
+        BOLD, DIM, UNDERLINE, BLINK, REVERSE, HIDDEN,
+    ))
+    STYLES_LIST = list(STYLES)
 
-        self.STYLES_LIST = list(self.STYLES.keys())
+    # Same table keyed by the lowercase names as well, so lookups
+    # with an exact-case key skip the per-call str.upper().
+    _STYLES_LOOKUP = _case_table(STYLES)
 
     def __getitem__(self, style):
+        try:
+            return self._STYLES_LOOKUP[style]
+        except (KeyError, TypeError):
+            pass
         try:
             return self.STYLES[style.upper()]
         except KeyError:
             raise ColorStyleError(style)
 
     def __contains__(self, style):
-        return style.upper() in self.STYLES
+        return style in self._STYLES_LOOKUP or style.upper() in self.STYLES
 
     def __str__(self):
         return str(self.STYLES_LIST)
\ No newline at end of file